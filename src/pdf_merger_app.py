@@ -8,19 +8,28 @@ PDF整理ツール
 
 依存:
   pip install PySide6 pypdf pymupdf
+  （任意）pip install pikepdf  … 結合・分割を QPDF で高速化
 """
 from __future__ import annotations
 
 import os
 import sys
 import re
+import subprocess
 import io
+import mmap
+import hashlib
 import traceback
+import multiprocessing
+from collections import OrderedDict, deque
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import IO, Callable, Dict, Iterator, List, Tuple, Optional, Union
 
 from PySide6 import QtCore, QtWidgets
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Qt, Signal, SIGNAL, QThread, QElapsedTimer
 from PySide6.QtGui import QAction, QImage, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
@@ -33,7 +42,6 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QListWidget,
-    QListWidgetItem,
     QMainWindow,
     QMessageBox,
     QProgressBar,
@@ -50,7 +58,10 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 
-from pypdf import PdfReader, PdfWriter
+from pypdf import PdfReader, PdfWriter, PasswordType
+
+# プレビュー画像の画素形式（MuPDF の RGB ピクスマップをそのまま渡す）
+_FMT_RGB = QImage.Format_RGB888
 
 # PyMuPDF（任意）。未導入でも他機能は動作。
 try:
@@ -59,46 +70,196 @@ try:
 except Exception:
     fitz = None
     _FitzOK = False
+else:
+    fitz.TOOLS.mupdf_display_warnings(False)
+
+# pikepdf（任意）。導入時は結合・分割のページコピーを QPDF(C++) で行う。
+try:
+    import pikepdf
+    _PikeOK = True
+except Exception:
+    pikepdf = None
+    _PikeOK = False
 
 
 APP_TITLE = "PDF整理ツール"
 VERSION = "v2.1.0"  # + preview pane
 
+# ワーカーのログ通知をまとめる単位（行数 / 経過ミリ秒）
+_LOG_FLUSH_LINES = 32
+_LOG_FLUSH_MS = 250
+# 重複判定でファイルをハッシュするときの読み込み単位
+_HASH_BLOCK_SIZE = 1024 * 1024
+# 出力ファイルの書き込みバッファ
+_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+# 結合: 先読みしておく入力ファイル数（読み込みスレッド数も兼ねる）
+_MERGE_PREFETCH = 4
+# 分割: プロセスプールへ渡す1ジョブあたりの出力件数 / 書き込み待ちにできる出力の数
+_SPLIT_WRITE_BATCH = 32
+_SPLIT_WRITE_QUEUE = 4
+# 出力件数と出力に含めるページ数の合計が両方これ以上ならプロセスプールで並列に分割する。
+# 子プロセスは起動・import・分割元の読み込みで約1秒かかり、1ページのコピーは約1.5ミリ秒なので、
+# 2プロセスでも元が取れるのは合計 1300 ページ程度から（件数の下限はバッチを2つ以上にするため）
+_SPLIT_POOL_MIN_JOBS = 64
+_SPLIT_POOL_MIN_PAGES = 2000
+# プロセスプールの上限（子プロセスごとに起動と import の費用がかかる。Windows では 61 を超えられない）
+_SPLIT_POOL_MAX_WORKERS = 8
+
+
+# 分割元パス入力からページ数の取得を始めるまでの待ち時間（ミリ秒）
+_PAGE_COUNT_DEBOUNCE_MS = 300
+
+
+# プレビュー: キャッシュ件数 / 合計バイト数の上限 / 先行表示する低解像度の倍率
+_PREVIEW_CACHE_SIZE = 64
+_PREVIEW_CACHE_BYTES = 128 * 1024 * 1024
+_PREVIEW_DRAFT_SCALE = 0.5
+# プレビュー: リサイズ/ズーム操作をまとめてから描画するまでの待ち時間（ミリ秒）
+_PREVIEW_DEBOUNCE_MS = 80
+# プレビュー: 表示後に空き時間で先に描画しておく前後のページ数
+_PREVIEW_PREWARM = 2
+# プレビュー: 解釈済みの描画命令（DisplayList）を保持するページ数
+_PREVIEW_DISPLAYLIST_CACHE = 16
+# 編集: ページ挿入元として使い回す PdfReader の数
+_INSERT_READER_CACHE = 8
+# 編集: 保存するページ数がこれ以上なら PyMuPDF で書き出す（pypdf は全ページを複製して抱えてから書く）
+_EDIT_LOWMEM_PAGES = 500
+
 
 # ---------- helpers ----------
+_NAT_RE = re.compile(r"\d+|\D+")
+
+
 def natural_key(s: str):
-    return [int(t) if t.isdigit() else t.lower() for t in re.findall(r"\d+|\D+", s)]
+    return [int(t) if t.isdigit() else t.lower() for t in _NAT_RE.findall(s)]
+
+
+# "3" / "3-5" を1トークンとして読む。"-" 以降が数字だけでなければ単ページ扱い（"3-"、"3-x"）
+_RANGE_RE = re.compile(r"(?:^|,)\s*(\+?\d+)\s*(?:-\s*(?:([+-]?\d+)\s*(?=,|$)|[^,]*))?(?=,|$)")
 
 
 def parse_ranges(text: str, total_pages: int) -> List[Tuple[int, int]]:
+    if total_pages >= 1 and (text or "").strip() == "*":
+        return [(1, total_pages)]  # 全ページ指定は正規表現を通さない
     rngs: List[Tuple[int, int]] = []
-    t = (text or "").strip()
-    if not t:
-        return rngs
-    for part in t.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        if "-" in part:
-            a, b = part.split("-", 1)
-            try:
-                start = max(1, min(total_pages, int(a)))
-            except ValueError:
-                continue
-            try:
-                end = max(1, min(total_pages, int(b)))
-            except ValueError:
-                end = start
-            if start > end:
-                start, end = end, start
-            rngs.append((start, end))
+    for m in _RANGE_RE.finditer(text or ""):
+        a, b = m.group(1, 2)
+        start = max(1, min(total_pages, int(a)))
+        end = max(1, min(total_pages, int(b))) if b else start
+        rngs.append((start, end) if start <= end else (end, start))
+    return rngs
+
+
+# OS の既定アプリでファイル/フォルダを開く（プラットフォーム判定は読み込み時に一度だけ）
+if sys.platform.startswith("win"):
+    def _open_native(path: str):
+        os.startfile(path)  # type: ignore[attr-defined]
+elif sys.platform == "darwin":
+    def _open_native(path: str):
+        subprocess.Popen(["open", path])
+else:
+    def _open_native(path: str):
+        subprocess.Popen(["xdg-open", path])
+
+
+def _open_for_write(path: str):
+    # 既定の 8 KiB バッファだと PDF ライタの細かい write がそのままシステムコールになる
+    return open(path, "wb", buffering=_WRITE_BUFFER_SIZE)
+
+
+def _fsync(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _file_digest(path: str) -> bytes:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            h.update(block)
+    return h.digest()
+
+
+def _write_file(path: str, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)  # 生成済みの bytes は1回の write で書き出す
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _prefetch_files(paths: List[Optional[str]]) -> Iterator[Optional[Future]]:
+    """paths の順に読み込み結果（Future）を返す。先の _MERGE_PREFETCH 件は別スレッドで読み込んでおく。
+    None の要素（読み込み不要）には None を返す"""
+    with ThreadPoolExecutor(max_workers=_MERGE_PREFETCH) as ex:
+        pending: "deque[Optional[Future]]" = deque()
+        it = iter(paths)
+
+        def submit_next():
+            # 次の読み込みを1件投入する（間の None はそのまま並べる）
+            for p in it:
+                pending.append(ex.submit(_read_file, p) if p is not None else None)
+                if p is not None:
+                    return
+
+        for _ in range(_MERGE_PREFETCH):
+            submit_next()
+        while pending:
+            fut = pending.popleft()
+            if fut is not None:
+                submit_next()
+            yield fut
+
+
+class _BackgroundWriter:
+    """生成済みの出力を別スレッドで書き出し、次の範囲の生成と書き込みを重ねる。
+    on_written は書き込みが終わった出力ごとに（書き込みスレッドから）put の tag を渡して呼ぶ"""
+
+    def __init__(self, on_written: Optional[Callable[[object], None]] = None):
+        self._queue: "queue.Queue[Optional[Tuple[str, bytes, object]]]" = queue.Queue(maxsize=_SPLIT_WRITE_QUEUE)
+        self._on_written = on_written
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is None:
+                path, data, tag = item
+                try:
+                    _write_file(path, data)
+                    if self._on_written is not None:
+                        self._on_written(tag)
+                except BaseException as e:
+                    self._error = e
+
+    def put(self, path: str, data: bytes, tag: object = None):
+        if self._error is not None:
+            raise self._error
+        self._queue.put((path, data, tag))  # キューが埋まっている間は生成側を待たせる
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
         else:
             try:
-                p = max(1, min(total_pages, int(part)))
-                rngs.append((p, p))
-            except ValueError:
-                continue
-    return rngs
+                self.close()
+            except BaseException:
+                pass  # 元の例外を優先する
 
 
 def rotate_page_inplace(page, deg: int):
@@ -113,77 +274,424 @@ def rotate_page_inplace(page, deg: int):
             page.rotate_counter_clockwise(90)
 
 
+def _add_rotated_page(writer: PdfWriter, page, deg: int):
+    """page の複製を writer に追加し、複製側だけを deg 回転する（読み込み元の PageObject は変えない）"""
+    added = writer.add_page(page)
+    if deg % 360:
+        rotate_page_inplace(added, deg)
+
+
 @dataclass
 class PdfItem:
+    # slots=True は 3.10 以降のため手書き（display はフィールド外で生成時に一度だけ整形）
+    __slots__ = ("path", "size", "display")
     path: str
     size: int
 
-    @property
-    def display(self) -> str:
+    def __post_init__(self):
         base = os.path.basename(self.path)
         kb = f"{self.size/1024:.1f} KB"
-        return f"{base}  —  {kb}"
+        self.display = f"{base}  —  {kb}"
+
+
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class _SplitSource:
+    """分割元PDF。一度だけ開き、各出力で解析済みの xref / ページを共有する"""
+
+    def __init__(self, pdf=None, doc=None, reader: Optional[PdfReader] = None,
+                 view: Optional[memoryview] = None):
+        self.pdf = pdf          # pikepdf
+        self.doc = doc          # PyMuPDF
+        self.reader = reader    # pypdf
+        self.view = view        # doc の読み込み元 mmap（None ならファイルから直接）
+        if pdf is not None:
+            self.total = len(pdf.pages)
+        elif doc is not None:
+            self.total = doc.page_count
+        else:
+            self.total = len(reader.pages)
+
+    def render(self, s1: int, e1: int) -> bytes:
+        buf = io.BytesIO()
+        if self.pdf is not None:
+            dst = pikepdf.Pdf.new()
+            try:
+                dst.pages.extend(self.pdf.pages[s1 - 1:e1])
+                dst.save(buf, linearize=False)
+            finally:
+                dst.close()
+            return buf.getvalue()
+        if self.doc is not None:
+            dst = fitz.open()
+            try:
+                dst.insert_pdf(self.doc, from_page=s1 - 1, to_page=e1 - 1)
+                return dst.tobytes(garbage=1, deflate=False, clean=False)
+            finally:
+                dst.close()
+        w = PdfWriter()
+        w.append(self.reader, pages=(s1 - 1, e1), import_outline=False)
+        w.write(buf)
+        return buf.getvalue()
+
+    def close(self):
+        if self.pdf is not None:
+            self.pdf.close()
+            self.pdf = None
+        if self.doc is not None:
+            self.doc.close()
+            self.doc = None
+        _unmap(self.view)
+        self.view = None
+
+
+def _map_file(path: str) -> Optional[memoryview]:
+    """読み取り専用で mmap し、全体の先読みを依頼する（分割では結局ほぼ全体を読むため）。
+    mmap できない場合（空ファイル等）は None"""
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if hasattr(mmap, "MADV_WILLNEED"):
+        mm.madvise(mmap.MADV_WILLNEED)
+    return memoryview(mm)
+
+
+def _unmap(view: Optional[memoryview]):
+    if view is None:
+        return
+    mm = view.obj
+    view.release()
+    mm.close()
+
+
+def _open_reader(path: Union[str, IO[bytes]]) -> Optional[PdfReader]:
+    """path（パスまたは読み込み済みのストリーム）を開く。空パスワードで開けない暗号化PDFの場合は None
+    （暗号化判定は trailer の /Encrypt を見るだけなので事前のファイル走査は不要）"""
+    reader = PdfReader(path, strict=False)
+    if reader.is_encrypted:
+        try:
+            if reader.decrypt("") == PasswordType.NOT_DECRYPTED:
+                return None
+        except Exception:
+            return None
+    return reader
+
+
+def _open_split_source(path: str) -> Optional[_SplitSource]:
+    """空パスワードで開けない暗号化PDFの場合は None"""
+    if _PikeOK:
+        try:
+            return _SplitSource(pdf=pikepdf.Pdf.open(path, password=""))
+        except pikepdf.PasswordError:
+            return None
+    if _FitzOK:
+        # ファイルは mmap 経由で渡し、ページごとのシーク+read をメモリアクセスにする
+        view = _map_file(path)
+        doc = None
+        try:
+            try:
+                doc = fitz.open(stream=view, filetype="pdf") if view is not None else fitz.open(path)
+            except TypeError:
+                # 古い PyMuPDF（1.24.0 など）は stream に memoryview を受け付けないのでファイルから開く
+                _unmap(view)
+                view = None
+                doc = fitz.open(path)
+            if not doc.needs_pass or doc.authenticate(""):
+                return _SplitSource(doc=doc, view=view)
+            doc.close()
+            doc = None
+            return None
+        finally:
+            if doc is None:
+                _unmap(view)
+    reader = _open_reader(path)
+    if reader is None:
+        return None
+    return _SplitSource(reader=reader)
+
+
+# 分割用プロセスプール（子プロセスごとに分割元を一度だけ開く）
+_pool_split_source: Optional[_SplitSource] = None
+
+
+def _split_pool_init(path: str):
+    global _pool_split_source
+    _pool_split_source = _open_split_source(path)
+
+
+def _split_pool_job(jobs: List[Tuple[str, int, int]]) -> None:
+    with _BackgroundWriter() as writer:
+        for out_path, s1, e1 in jobs:
+            writer.put(out_path, _pool_split_source.render(s1, e1))
+
+
+# ---------- merge targets ----------
+# 結合先のバックエンド。開く/追加/保存だけを持ち、入力のループは MergeWorker._merge が共通で行う
+class _PikeMergeTarget:
+    name = "pikepdf"
+
+    def __init__(self):
+        # QPDF がオブジェクトグラフを C++ 側でコピーする（Python での再シリアライズなし）
+        self.out = pikepdf.Pdf.new()
+        self._sources = []  # コピー元は保存が終わるまで開いておく必要がある
+
+    def open(self, data: bytes):
+        """暗号化で開けなければ None"""
+        try:
+            return pikepdf.Pdf.open(io.BytesIO(data), password="")
+        except pikepdf.PasswordError:
+            return None
+
+    def append(self, src) -> int:
+        """src の全ページを末尾に追加し、先頭ページの位置を返す"""
+        self._sources.append(src)
+        start = len(self.out.pages)
+        self.out.pages.extend(src.pages)
+        return start
+
+    def save(self, path: str, toc: List[Tuple[str, int]], log: Callable[[str], None]):
+        if toc:
+            try:
+                with self.out.open_outline() as outline:
+                    outline.root.extend(pikepdf.OutlineItem(title, page) for title, page in toc)
+            except Exception:
+                log("ブックマーク追加失敗")
+        with _open_for_write(path) as f:
+            self.out.save(f, linearize=False)
+            _fsync(f)
+
+    def close(self):
+        self.out.close()
+        for src in self._sources:
+            src.close()
+
+
+class _FitzMergeTarget:
+    name = "PyMuPDF"
+
+    def __init__(self):
+        # PyMuPDF はオブジェクトを再エンコードせずにそのままコピーする
+        self.out = fitz.open()
+
+    def open(self, data: bytes):
+        # fitz.open / insert_pdf はスレッドセーフでないため、並行するのはファイル読み込みだけ
+        src = fitz.open(stream=data, filetype="pdf")
+        if src.needs_pass and not src.authenticate(""):
+            src.close()
+            return None
+        return src
+
+    def append(self, src) -> int:
+        try:
+            start = self.out.page_count
+            self.out.insert_pdf(src)
+            return start
+        finally:
+            src.close()
+            # 閉じた入力の描画/解析キャッシュを MuPDF のストアから捨てる
+            fitz.TOOLS.store_shrink(100)
+
+    def save(self, path: str, toc: List[Tuple[str, int]], log: Callable[[str], None]):
+        if self.out.page_count == 0:
+            # PyMuPDF は0ページの文書を保存できないため pypdf で空のPDFを書き出す
+            with _open_for_write(path) as f:
+                PdfWriter().write(f)
+                _fsync(f)
+            return
+        if toc:
+            try:
+                self.out.set_toc([[1, title, page + 1] for title, page in toc])
+            except Exception:
+                log("ブックマーク追加失敗")
+        with _open_for_write(path) as f:
+            # 連結するだけなので未使用オブジェクト回収や再圧縮は行わない
+            self.out.save(f, garbage=0, deflate=False)
+            _fsync(f)
+
+    def close(self):
+        self.out.close()
+
+
+class _PypdfMergeTarget:
+    name = "pypdf"
+
+    def __init__(self):
+        self.writer = PdfWriter()
+
+    def open(self, data: bytes) -> Optional[PdfReader]:
+        return _open_reader(io.BytesIO(data))
+
+    def append(self, reader: PdfReader) -> int:
+        start = len(self.writer.pages)
+        # append は元の PdfReader を共有したまま参照単位でコピーする
+        self.writer.append(reader, import_outline=False)
+        return start
+
+    def save(self, path: str, toc: List[Tuple[str, int]], log: Callable[[str], None]):
+        if toc:
+            # parent を省略すると項目ごとにルートをオブジェクト表から線形探索するため、一度だけ取得して渡す
+            root = self.writer.get_outline_root()
+            for title, page in toc:
+                try:
+                    self.writer.add_outline_item(title, page, parent=root)
+                except Exception:
+                    log(f"ブックマーク追加失敗: {title}")
+        with _open_for_write(path) as f:
+            self.writer.write(f)
+            _fsync(f)
+
+    def close(self):
+        pass
 
 
 # ---------- workers ----------
+class _WorkerFeedback:
+    """ワーカーの進捗/ログ通知を間引く（スレッド間シグナルで UI のイベントキューを溢れさせない）。
+    progress / message は通知先の呼び出し（シグナルの emit、UI スレッドならウィジェットの更新）"""
+
+    def __init__(self, progress: Callable[[int], None], message: Callable[[str], None], logging: bool = True):
+        self._progress = progress
+        self._message = message
+        self._logging = logging  # ログの接続先がなければ行を溜めない
+        self._last_pct = -1
+        self._lines: List[str] = []
+        self._clock = QElapsedTimer()  # 未開始の間は最初の1行をすぐ流す
+
+    def progress(self, done: int, total: int):
+        pct = int(done / total * 100)
+        if pct != self._last_pct:
+            self.flush()
+            self._last_pct = pct
+            self._progress(pct)
+
+    def log(self, line: str):
+        if not self._logging:
+            return
+        self._lines.append(line)
+        if (len(self._lines) >= _LOG_FLUSH_LINES or not self._clock.isValid()
+                or self._clock.hasExpired(_LOG_FLUSH_MS)):
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            self._message("\n".join(self._lines))
+            self._lines.clear()
+        self._clock.start()
+
+    def fail(self, worker, e: BaseException):
+        """worker.error に例外を残し、溜めたログを流してから finished_error を通知する"""
+        # スタックトレースの整形は UI 側で詳細を表示するときまで遅らせる
+        worker.error = traceback.TracebackException.from_exception(e, lookup_lines=False)
+        self.flush()
+        worker.finished_error.emit(f"{type(e).__name__}: {e}")
+
+
 class MergeWorker(QThread):
     progress = Signal(int)
     message = Signal(str)
     finished_ok = Signal(str)
     finished_error = Signal(str)
 
-    def __init__(self, items: List[PdfItem], out_path: str, add_bookmarks: bool, parent=None):
+    def __init__(self, items: List[PdfItem], out_path: str, add_bookmarks: bool,
+                 skip_duplicates: bool = False, parent=None):
         super().__init__(parent)
         self.items = items
         self.out_path = out_path
         self.add_bookmarks = add_bookmarks
+        self.skip_duplicates = skip_duplicates
+        self._dup_of: Dict[int, int] = {}
+        self.error: Optional[traceback.TracebackException] = None
 
     def run(self):
+        self.error = None
+        self._feedback = _WorkerFeedback(self.progress.emit, self.message.emit, self.receivers(SIGNAL("message(QString)")) > 0)
         try:
             if not self.items:
                 self.finished_error.emit("結合対象のPDFがありません。")
                 return
 
-            writer = PdfWriter()
-            total = len(self.items)
-            done = 0
-
-            for item in self.items:
-                self.message.emit(f"読み込み中: {item.path}")
+            os.makedirs(os.path.dirname(self.out_path) or ".", exist_ok=True)
+            if self.skip_duplicates:
+                self._dup_of = self._find_duplicates()
+            targets = []
+            if _PikeOK:
+                targets.append(_PikeMergeTarget)
+            if _FitzOK:
+                targets.append(_FitzMergeTarget)
+            targets.append(_PypdfMergeTarget)
+            for i, target in enumerate(targets):
                 try:
-                    reader = PdfReader(item.path, strict=False)
-                    if reader.is_encrypted:
-                        try:
-                            reader.decrypt("")
-                        except Exception:
-                            self.message.emit(f"スキップ(暗号化): {item.path}")
-                            done += 1
-                            self.progress.emit(int(done/total*100))
-                            continue
-
-                    start_page_index = len(writer.pages)
-                    for p in reader.pages:
-                        writer.add_page(p)
+                    self._merge(target())
+                    break
+                except OSError:
+                    raise  # 出力先への書き込み失敗はバックエンドを替えても同じなので再試行しない
+                except Exception as e:
+                    if i == len(targets) - 1:
+                        raise
+                    self._feedback.log(f"{target.name}での結合に失敗したため {targets[i+1].name} で再試行します  —  {e}")
 
+            self._feedback.flush()
+            self.finished_ok.emit(self.out_path)
+        except Exception as e:
+            self._feedback.fail(self, e)
+
+    def _read_paths(self) -> List[Optional[str]]:
+        """先読み対象（重複としてスキップする入力は読まない）"""
+        return [None if i in self._dup_of else it.path for i, it in enumerate(self.items)]
+
+    def _find_duplicates(self) -> Dict[int, int]:
+        """内容が同じファイルを {重複の添字: 最初の添字} で返す。サイズが一致するものだけハッシュする"""
+        by_size: Dict[int, List[int]] = {}
+        for i, item in enumerate(self.items):
+            by_size.setdefault(item.size, []).append(i)
+        dup_of: Dict[int, int] = {}
+        for idxs in by_size.values():
+            if len(idxs) < 2:
+                continue
+            first_by_digest: Dict[bytes, int] = {}
+            for i in idxs:
+                try:
+                    digest = _file_digest(self.items[i].path)
+                except OSError:
+                    continue
+                first = first_by_digest.setdefault(digest, i)
+                if first != i:
+                    dup_of[i] = first
+        return dup_of
+
+    def _merge(self, target):
+        """入力の読み込み・重複/暗号化/エラーのスキップ・ブックマーク・進捗はバックエンドによらず共通"""
+        toc: List[Tuple[str, int]] = []  # (タイトル, 0始まりのページ番号)
+        starts: Dict[int, int] = {}
+        total = len(self.items)
+        try:
+            for i, (item, fut) in enumerate(zip(self.items, _prefetch_files(self._read_paths()))):
+                self._feedback.log(f"読み込み中: {item.path}")
+                try:
+                    first = self._dup_of.get(i)
+                    if first is not None:
+                        self._feedback.log(f"スキップ(重複): {item.path}")
+                        if self.add_bookmarks and first in starts:
+                            toc.append((os.path.basename(item.path), starts[first]))
+                        continue
+                    src = target.open(fut.result())
+                    if src is None:
+                        self._feedback.log(f"スキップ(暗号化): {item.path}")
+                        continue
+                    starts[i] = target.append(src)
                     if self.add_bookmarks:
-                        try:
-                            writer.add_outline_item(os.path.basename(item.path), start_page_index)
-                        except Exception:
-                            self.message.emit(f"ブックマーク追加失敗: {os.path.basename(item.path)}")
-
+                        toc.append((os.path.basename(item.path), starts[i]))
                 except Exception as e:
-                    self.message.emit(f"スキップ(エラー): {item.path}  —  {e}")
+                    self._feedback.log(f"スキップ(エラー): {item.path}  —  {e}")
                 finally:
-                    done += 1
-                    self.progress.emit(int(done/total*100))
-
-            os.makedirs(os.path.dirname(self.out_path) or ".", exist_ok=True)
-            with open(self.out_path, "wb") as f:
-                writer.write(f)
-
-            self.finished_ok.emit(self.out_path)
-        except Exception:
-            self.finished_error.emit(traceback.format_exc())
+                    self._feedback.progress(i + 1, total)
+            target.save(self.out_path, toc, self._feedback.log)
+        finally:
+            target.close()
 
 
 class SplitWorker(QThread):
@@ -208,61 +716,108 @@ class SplitWorker(QThread):
         self.ranges_text = ranges_text
         self.pad = max(1, int(pad))
         self.start_index = int(start_index)
+        self.error: Optional[traceback.TracebackException] = None
 
     def run(self):
+        self.error = None
+        self._feedback = _WorkerFeedback(self.progress.emit, self.message.emit, self.receivers(SIGNAL("message(QString)")) > 0)
         try:
             if not os.path.exists(self.src_path):
                 self.finished_error.emit("分割元PDFが存在しません。")
                 return
             os.makedirs(self.out_dir or ".", exist_ok=True)
 
-            reader = PdfReader(self.src_path, strict=False)
-            if reader.is_encrypted:
-                try:
-                    reader.decrypt("")
-                except Exception:
-                    self.finished_error.emit("暗号化PDFは分割できません。パスワード解除後に再実行してください。")
-                    return
+            source = _open_split_source(self.src_path)
+            if source is None:
+                self.finished_error.emit("暗号化PDFは分割できません。パスワード解除後に再実行してください。")
+                return
 
-            total = len(reader.pages)
-            idx = self.start_index
-
-            def write_range(s1: int, e1: int):
-                nonlocal idx
-                w = PdfWriter()
-                for p in range(s1 - 1, e1):
-                    w.add_page(reader.pages[p])
-                out_path = os.path.join(self.out_dir, f"{self.filename_prefix}_{str(idx).zfill(self.pad)}.pdf")
-                with open(out_path, "wb") as f:
-                    w.write(f)
-                self.message.emit(f"出力: {out_path} (p{s1}-{e1})")
-                idx += 1
-
-            if self.mode == self.MODE_EACH:
-                for p in range(1, total + 1):
-                    write_range(p, p)
-                    self.progress.emit(int(p / total * 100))
-            elif self.mode == self.MODE_CHUNK:
-                chunks = (total + self.chunk_size - 1) // self.chunk_size
-                done = 0
-                for c in range(chunks):
-                    s = c * self.chunk_size + 1
-                    e = min(total, (c + 1) * self.chunk_size)
-                    write_range(s, e)
-                    done = e
-                    self.progress.emit(int(done / total * 100))
-            else:
-                rs = parse_ranges(self.ranges_text, total)
-                if not rs:
-                    self.finished_error.emit("カスタム範囲の指定が不正です。例: 1-3,5,7-10")
-                    return
-                for i, (s, e) in enumerate(rs, start=1):
-                    write_range(s, e)
-                    self.progress.emit(int(i / len(rs) * 100))
+            try:
+                total = source.total
+                if self.mode == self.MODE_EACH:
+                    ranges = [(p, p) for p in range(1, total + 1)]
+                elif self.mode == self.MODE_CHUNK:
+                    ranges = [(s, min(total, s + self.chunk_size - 1)) for s in range(1, total + 1, self.chunk_size)]
+                else:
+                    ranges = parse_ranges(self.ranges_text, total)
+                    if not ranges:
+                        self.finished_error.emit("カスタム範囲の指定が不正です。例: 1-3,5,7-10")
+                        return
+
+                jobs = [
+                    (os.path.join(self.out_dir, f"{self.filename_prefix}_{str(self.start_index + i).zfill(self.pad)}.pdf"), s1, e1)
+                    for i, (s1, e1) in enumerate(ranges)
+                ]
+                if self._use_process_pool(jobs):
+                    self._write_in_processes(jobs)
+                else:
+                    self._write_pipelined(source, jobs)
+            finally:
+                source.close()
 
+            self._feedback.flush()
             self.finished_ok.emit(self.out_dir)
+        except Exception as e:
+            self._feedback.fail(self, e)
+
+    @staticmethod
+    def _use_process_pool(jobs: List[Tuple[str, int, int]]) -> bool:
+        # 出力件数ではなくコピーするページ数で仕事量を見積もる（1ページずつの分割は件数だけ多く軽い）
+        if len(jobs) < _SPLIT_POOL_MIN_JOBS or (os.cpu_count() or 1) < 2:
+            return False
+        return sum(e1 - s1 + 1 for _, s1, e1 in jobs) >= _SPLIT_POOL_MIN_PAGES
+
+    def _report_written(self, batch: List[Tuple[str, int, int]], done: int, total: int):
+        for out_path, s1, e1 in batch:
+            self._feedback.log(f"出力: {out_path} (p{s1}-{e1})")
+        self._feedback.progress(done, total)
+
+    def _write_pipelined(self, source: _SplitSource, jobs: List[Tuple[str, int, int]]):
+        # 「出力:」と進捗は書き込みが終わってから出す（ログと通知は書き込みスレッドからだけ行う）
+        with _BackgroundWriter(lambda i: self._report_written(jobs[i - 1:i], i, len(jobs))) as writer:
+            for i, (out_path, s1, e1) in enumerate(jobs, start=1):
+                writer.put(out_path, source.render(s1, e1), i)
+
+    def _write_in_processes(self, jobs: List[Tuple[str, int, int]]):
+        # 範囲ごとの生成は互いに独立なので、プロセスに分けて GIL を回避する
+        batches = [jobs[i:i + _SPLIT_WRITE_BATCH] for i in range(0, len(jobs), _SPLIT_WRITE_BATCH)]
+        workers = min(os.cpu_count() or 1, len(batches), _SPLIT_POOL_MAX_WORKERS)
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                 initializer=_split_pool_init, initargs=(self.src_path,)) as pool:
+            futures = [pool.submit(_split_pool_job, b) for b in batches]
+            done = 0
+            try:
+                for batch, fut in zip(batches, futures):
+                    fut.result()
+                    done += len(batch)
+                    self._report_written(batch, done, len(jobs))
+            except BaseException:
+                # 待機中のバッチは取り消し、子プロセスに渡し済みの分だけ待つ（スレッド内の分割と同じく最初の失敗で止める）。
+                # wait=False だと with を抜けても子プロセスを待たず、失敗を報告した後も書き込みが続く
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+
+
+class PageCountWorker(QThread):
+    """分割元のページ数を別スレッドで数える（大きな/ネットワーク上のPDFでも入力中の UI を止めない）"""
+    finished_count = Signal(int, str)  # (世代番号, 表示文字列)
+
+    def __init__(self, path: str, generation: int, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.generation = generation
+
+    def run(self):
+        try:
+            if not os.path.exists(self.path):
+                text = "ページ数: -"
+            else:
+                r = _open_reader(self.path)
+                text = "ページ数: 暗号化" if r is None else f"ページ数: {len(r.pages)}"
         except Exception:
-            self.finished_error.emit(traceback.format_exc())
+            text = "ページ数: 取得失敗"
+        self.finished_count.emit(self.generation, text)
 
 
 # ---------- main window ----------
@@ -382,16 +937,19 @@ class PdfManagerWindow(QMainWindow):
         right.addWidget(self.chk_bookmark, 4, 1)
         right.addWidget(self.chk_open, 4, 2)
 
+        self.chk_dedup = QCheckBox("同じ内容のPDFは1回だけ結合する")
+        right.addWidget(self.chk_dedup, 5, 1, 1, 2)
+
         self.btn_merge = QPushButton("▶ 結合を実行")
         self.btn_merge.setMinimumHeight(44)
-        right.addWidget(self.btn_merge, 5, 1, 1, 2)
+        right.addWidget(self.btn_merge, 6, 1, 1, 2)
 
         self.prog_merge = QProgressBar(); self.prog_merge.setRange(0, 100)
         self.log_merge = QTextEdit(); self.log_merge.setReadOnly(True); self.log_merge.setMinimumHeight(140)
-        right.addWidget(QLabel("進捗"), 6, 0)
-        right.addWidget(self.prog_merge, 6, 1, 1, 2)
-        right.addWidget(QLabel("ログ"), 7, 0)
-        right.addWidget(self.log_merge, 7, 1, 1, 2)
+        right.addWidget(QLabel("進捗"), 7, 0)
+        right.addWidget(self.prog_merge, 7, 1, 1, 2)
+        right.addWidget(QLabel("ログ"), 8, 0)
+        right.addWidget(self.log_merge, 8, 1, 1, 2)
 
         main.addWidget(left_box, 0, 0, 2, 1)
         main.addWidget(right_box, 0, 1, 2, 1)
@@ -486,7 +1044,13 @@ class PdfManagerWindow(QMainWindow):
         self.btn_src.clicked.connect(self.on_select_src)
         self.btn_outdir.clicked.connect(self.on_select_outdir)
         self.btn_split.clicked.connect(self.on_split)
-        self.txt_src.textChanged.connect(self._update_page_count)
+        # 入力中は数えず、入力が止まってから最新のパスだけを数える
+        self._page_count_gen = 0
+        self._page_count_timer = QtCore.QTimer(self)
+        self._page_count_timer.setSingleShot(True)
+        self._page_count_timer.setInterval(_PAGE_COUNT_DEBOUNCE_MS)
+        self._page_count_timer.timeout.connect(self._update_page_count)
+        self.txt_src.textChanged.connect(self._page_count_timer.start)
 
     # --- Edit Tab (with preview) ---
     def _build_edit_tab(self, host: QWidget):
@@ -577,14 +1141,32 @@ class PdfManagerWindow(QMainWindow):
         grid.setRowStretch(6, 1)
 
         # Edit state
-        self._edit_pages: List = []          # PageObject list (pypdf)
+        # (読み込み元, 元のページ番号, 編集で加えた回転)。PageObject は必要時に引き、書き換えない
+        # （挿入元の reader は挿入どうし・読み込み直し後も共有されるため、回転は行ごとにここで持つ）
+        self._edit_pages: List[Tuple[PdfReader, int, int]] = []
         self._edit_src_reader: Optional[PdfReader] = None
         self._edit_src_path: Optional[str] = None
+        self._edit_fitz_docs: Dict[PdfReader, Optional["fitz.Document"]] = {}  # プレビュー用に読み込み元ごと一度だけ開く
+        # (絶対パス, 更新時刻) → 挿入元 PdfReader。同じファイルから続けて挿入するとき xref を読み直さない
+        self._inserter_readers: "OrderedDict[Tuple[str, float], Optional[PdfReader]]" = OrderedDict()
 
         # Preview state
         self._preview_zoom_mode = "fitw"  # "fitw" / "fitp" / "free"
         self._preview_scale = 1.0         # used when free zoom
         self._current_preview_index = -1
+        self._preview_generation = 0      # 遅延描画が古くなったかの判定用
+        self._last_render_key: Optional[tuple] = None  # 表示中の本描画（同じ要求なら描き直さない）
+        # (読み込み元, 元のページ番号, rotation, scale, devicePixelRatio) の LRU。行番号ではなくページで引くので並べ替えても残る
+        self._preview_cache: "OrderedDict[Tuple[PdfReader, int, int, float, float], QPixmap]" = OrderedDict()
+        self._preview_cache_bytes = 0
+        # (読み込み元, 元のページ番号, rotation) → DisplayList。ズーム変更ではコンテンツストリームを解釈し直さない
+        self._preview_displaylists: "OrderedDict[Tuple[PdfReader, int, int], fitz.DisplayList]" = OrderedDict()
+        self._render_timer = QtCore.QTimer(self)  # 連続するリサイズ/ズームは最後の1回だけ描画する
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(_PREVIEW_DEBOUNCE_MS)
+        # PyMuPDF の有無は起動中に変わらないので、描画のたびに判定せず最初に決めておく
+        self._render_preview = self._render_preview_impl if _FitzOK else self._render_preview_disabled
+        self._render_timer.timeout.connect(lambda: self._render_preview(self._current_preview_index))
 
         # Signals
         self.btn_edit_src.clicked.connect(self.on_edit_select_src)
@@ -648,34 +1230,54 @@ class PdfManagerWindow(QMainWindow):
         help_menu.addAction(act_about); help_menu.addAction(act_how)
 
     # --- common logs ---
+    def _log_worker_msg(self, log: QTextEdit, s: str):
+        # ワーカーからは複数行がまとめて届く。ステータスバーには最後の行だけ出す
+        log.append(s); self.status.showMessage(s.rsplit("\n", 1)[-1], 5000)
+
     def log_msg_merge(self, s: str):
-        self.log_merge.append(s); self.status.showMessage(s, 5000)
+        self._log_worker_msg(self.log_merge, s)
 
     def log_msg_split(self, s: str):
-        self.log_split.append(s); self.status.showMessage(s, 5000)
+        self._log_worker_msg(self.log_split, s)
 
     def log_msg_edit(self, s: str):
         self.log_edit.append(s); self.status.showMessage(s, 5000)
 
+    def _show_worker_error(self, text: str, detail: str, worker):
+        box = QMessageBox(QMessageBox.Critical, APP_TITLE, f"{text}\n\n詳細:\n{detail}", QMessageBox.Ok, self)
+        if worker.error is not None:
+            box.setDetailedText("".join(worker.error.format()))  # 「詳細の表示」で確認できる
+        box.exec()
+
     # ---------- Merge helpers/slots ----------
     def _collect_pdfs(self, folder: str, recursive: bool) -> List[PdfItem]:
+        # os.scandir の DirEntry.stat() は走査時の情報を使うため、ファイルごとの stat 呼び出しを省ける
         paths: List[Tuple[str, os.stat_result]] = []
         if recursive:
-            for root, _, files in os.walk(folder):
-                for fn in files:
-                    if fn.lower().endswith(".pdf"):
-                        p = os.path.join(root, fn)
-                        try: st = os.stat(p)
-                        except Exception: continue
-                        paths.append((p, st))
+            stack = [folder]
+            while stack:
+                subdirs = []
+                try:
+                    with os.scandir(stack.pop()) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir():
+                                    if not entry.is_symlink():
+                                        subdirs.append(entry.path)
+                                elif entry.name.lower().endswith(".pdf"):
+                                    paths.append((entry.path, entry.stat()))
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+                stack.extend(reversed(subdirs))  # os.walk と同じ順序で辿る
         else:
             try:
-                for fn in os.listdir(folder):
-                    if fn.lower().endswith(".pdf"):
-                        p = os.path.join(folder, fn)
-                        try: st = os.stat(p)
-                        except Exception: continue
-                        paths.append((p, st))
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.name.lower().endswith(".pdf"):
+                            try: paths.append((entry.path, entry.stat()))
+                            except Exception: continue
             except FileNotFoundError:
                 pass
 
@@ -696,11 +1298,20 @@ class PdfManagerWindow(QMainWindow):
         return [PdfItem(path=p, size=st.st_size) for p, st in paths]
 
     def _refresh_list_widget(self):
-        self.list_widget.clear()
-        for it in self.items:
-            item = QListWidgetItem(it.display)
-            item.setData(Qt.UserRole, it.path)
-            self.list_widget.addItem(item)
+        # 追加のたびに再レイアウト/シグナルが走らないよう、まとめて更新する
+        lw = self.list_widget
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            lw.clear()
+            # 表示文字列は addItems で一括投入し、パスだけ後から付与する
+            lw.addItems([it.display for it in self.items])
+            item = lw.item
+            for i, it in enumerate(self.items):
+                item(i).setData(Qt.UserRole, it.path)
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
         self.status.showMessage(f"{len(self.items)} 件のPDFを読み込みました。", 4000)
 
     def _sync_model_from_list(self):
@@ -776,7 +1387,7 @@ class PdfManagerWindow(QMainWindow):
 
         self.log_merge.clear(); self.prog_merge.setValue(0); self.btn_merge.setEnabled(False)
 
-        self.merge_worker = MergeWorker(self.items[:], out, self.chk_bookmark.isChecked())
+        self.merge_worker = MergeWorker(self.items[:], out, self.chk_bookmark.isChecked(), self.chk_dedup.isChecked())
         self.merge_worker.progress.connect(self.prog_merge.setValue)
         self.merge_worker.message.connect(self.log_msg_merge)
         self.merge_worker.finished_ok.connect(self._on_merge_finished_ok)
@@ -788,17 +1399,12 @@ class PdfManagerWindow(QMainWindow):
         self.log_msg_merge(f"完了: {out_path}")
         QMessageBox.information(self, APP_TITLE, f"PDFの結合が完了しました。\n\n出力: {out_path}")
         if hasattr(self, "chk_open") and self.chk_open.isChecked():
-            try:
-                if sys.platform.startswith("win"): os.startfile(out_path)  # type: ignore[attr-defined]
-                elif sys.platform == "darwin":
-                    import subprocess; subprocess.Popen(["open", out_path])
-                else:
-                    import subprocess; subprocess.Popen(["xdg-open", out_path])
+            try: _open_native(out_path)
             except Exception: pass
 
     def _on_merge_finished_error(self, detail: str):
         self.log_msg_merge("エラーが発生しました。ログを確認してください。")
-        QMessageBox.critical(self, APP_TITLE, "PDFの結合に失敗しました。\n\n詳細:\n" + detail)
+        self._show_worker_error("PDFの結合に失敗しました。", detail, self.merge_worker)
 
     # ---------- Split slots ----------
     def on_select_src(self):
@@ -810,18 +1416,19 @@ class PdfManagerWindow(QMainWindow):
         if d: self.txt_outdir.setText(d)
 
     def _update_page_count(self):
+        self._page_count_gen += 1  # 実行中の取得結果は古くなる
         p = self.txt_src.text().strip()
-        if not p or not os.path.exists(p):
+        if not p:
             self.lbl_pages.setText("ページ数: -"); return
-        try:
-            r = PdfReader(p, strict=False)
-            if r.is_encrypted:
-                try: r.decrypt("")
-                except Exception:
-                    self.lbl_pages.setText("ページ数: 暗号化"); return
-            self.lbl_pages.setText(f"ページ数: {len(r.pages)}")
-        except Exception:
-            self.lbl_pages.setText("ページ数: 取得失敗")
+        self.lbl_pages.setText("ページ数: 取得中…")
+        w = PageCountWorker(p, self._page_count_gen, self)  # 親を持たせ、終了後は Qt 側で破棄する
+        w.finished_count.connect(self._on_page_count)
+        w.finished.connect(w.deleteLater)
+        w.start()
+
+    def _on_page_count(self, generation: int, text: str):
+        if generation == self._page_count_gen:
+            self.lbl_pages.setText(text)
 
     def on_split(self):
         src = self.txt_src.text().strip()
@@ -853,46 +1460,59 @@ class PdfManagerWindow(QMainWindow):
     def _on_split_finished_ok(self, out_dir: str):
         self.log_msg_split(f"分割完了: {out_dir}")
         QMessageBox.information(self, APP_TITLE, f"PDFの分割が完了しました。\n\n出力フォルダ: {out_dir}")
-        try:
-            if sys.platform.startswith("win"): os.startfile(out_dir)  # type: ignore[attr-defined]
-            elif sys.platform == "darwin":
-                import subprocess; subprocess.Popen(["open", out_dir])
-            else:
-                import subprocess; subprocess.Popen(["xdg-open", out_dir])
+        try: _open_native(out_dir)
         except Exception: pass
 
     def _on_split_finished_error(self, detail: str):
         self.log_msg_split("エラーが発生しました。ログを確認してください。")
-        QMessageBox.critical(self, APP_TITLE, "PDFの分割に失敗しました。\n\n詳細:\n" + detail)
+        self._show_worker_error("PDFの分割に失敗しました。", detail, self.split_worker)
 
     # ---------- Edit helpers ----------
     def _refresh_edit_list(self):
-        self.list_edit_pages.clear()
-        for i, _ in enumerate(self._edit_pages, start=1):
-            self.list_edit_pages.addItem(f"ページ {i}")
+        # 結合タブの一覧と同様、再レイアウト/シグナルを止めて一括で入れ直す
+        lw = self.list_edit_pages
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            lw.clear()
+            lw.addItems([f"ページ {i}" for i in range(1, len(self._edit_pages) + 1)])
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+        self._on_edit_selection_changed(lw.currentRow())  # clear() で選択が外れたことだけは反映する
         self.lbl_edit_pages.setText(f"ページ数: {len(self._edit_pages)}")
 
+    def _edit_page(self, row: int):
+        reader, index, _ = self._edit_pages[row]
+        return reader.pages[index]
+
+    def _edit_rotation(self, row: int) -> int:
+        """表示/保存するときの向き（元ページの /Rotate + 編集で加えた回転）"""
+        reader, index, extra = self._edit_pages[row]
+        return (reader.pages[index].rotation + extra) % 360
+
     def _edit_load_from_path(self):
         p = self.txt_edit_src.text().strip()
         if not p or not os.path.exists(p):
             self._edit_pages = []; self._edit_src_reader = None; self._edit_src_path = None
+            self._close_edit_fitz_docs()
             self._refresh_edit_list()
             self._render_preview(-1)
             return
         try:
-            r = PdfReader(p, strict=False)
-            if r.is_encrypted:
-                try: r.decrypt("")
-                except Exception:
-                    QMessageBox.warning(self, APP_TITLE, "暗号化PDFは読み込めません。"); return
+            r = _open_reader(p)
+            if r is None:
+                QMessageBox.warning(self, APP_TITLE, "暗号化PDFは読み込めません。"); return
+            self._close_edit_fitz_docs()
             self._edit_src_reader = r
             self._edit_src_path = p
-            self._edit_pages = [r.pages[i] for i in range(len(r.pages))]
+            self._edit_pages = [(r, i, 0) for i in range(len(r.pages))]
             self._refresh_edit_list()
             self.log_msg_edit(f"読み込み: {p}")
             self.list_edit_pages.setCurrentRow(0)
         except Exception as e:
             self._edit_pages = []; self._edit_src_reader = None; self._edit_src_path = None
+            self._close_edit_fitz_docs()
             self._refresh_edit_list()
             self._render_preview(-1)
             QMessageBox.critical(self, APP_TITLE, f"読み込みに失敗しました。\n\n{e}")
@@ -904,18 +1524,20 @@ class PdfManagerWindow(QMainWindow):
 
     def _on_edit_selection_changed(self, row: int):
         self._current_preview_index = row
+        self._render_timer.stop()  # ページ切り替えは待たずに描画する
         self._render_preview(row)
 
     def on_edit_delete_pages(self):
         if not self._edit_pages:
             QMessageBox.warning(self, APP_TITLE, "PDFを読み込んでください。"); return
-        rows = sorted({i.row() for i in self.list_edit_pages.selectedIndexes()}, reverse=True)
+        rows = {i.row() for i in self.list_edit_pages.selectedIndexes()}
         if not rows:
             QMessageBox.information(self, APP_TITLE, "削除するページを選択してください。"); return
-        for r in rows:
-            self._edit_pages.pop(r)
+        removed = {self._edit_pages[r][:2] for r in rows}
+        self._edit_pages = [ref for i, ref in enumerate(self._edit_pages) if i not in rows]  # pop の繰り返しによる詰め直しを避ける
+        self._drop_preview_cache(removed.difference(ref[:2] for ref in self._edit_pages))  # 複製で残っているページの描画は残す
         self._refresh_edit_list()
-        next_row = min(rows[-1], len(self._edit_pages)-1) if self._edit_pages else -1
+        next_row = min(min(rows), len(self._edit_pages)-1) if self._edit_pages else -1
         self.list_edit_pages.setCurrentRow(next_row)
         self.log_msg_edit(f"削除: {len(rows)}ページ")
 
@@ -930,8 +1552,9 @@ class PdfManagerWindow(QMainWindow):
         if not path.lower().endswith(".pdf"): path += ".pdf"
         w = PdfWriter()
         for r in rows:
-            w.add_page(self._edit_pages[r])
-        with open(path, "wb") as f:
+            reader, index, extra = self._edit_pages[r]
+            _add_rotated_page(w, reader.pages[index], extra)
+        with _open_for_write(path) as f:
             w.write(f)
         self.log_msg_edit(f"抽出: {len(rows)}ページ -> {path}")
         QMessageBox.information(self, APP_TITLE, f"抽出しました。\n\n出力: {path}")
@@ -943,9 +1566,10 @@ class PdfManagerWindow(QMainWindow):
         if not rows:
             QMessageBox.information(self, APP_TITLE, "回転するページを選択してください。"); return
         for r in rows:
-            rotate_page_inplace(self._edit_pages[r], deg)
-        self._refresh_edit_list()
-        # 再描画
+            reader, index, extra = self._edit_pages[r]
+            self._edit_pages[r] = (reader, index, (extra + deg) % 360)
+        # 描画キャッシュは向きごとに持つので旧い向きも捨てない（同じページの別の行が使うことがある）。
+        # ページ数も並びも変わらないので一覧は作り直さない（選択もそのまま残る）。プレビューだけ描き直す
         self._render_preview(self._current_preview_index)
         self.log_msg_edit(f"回転: {len(rows)}ページ ({'左' if deg<0 else '右'}90°)")
 
@@ -955,11 +1579,24 @@ class PdfManagerWindow(QMainWindow):
         rows = sorted({i.row() for i in self.list_edit_pages.selectedIndexes()})
         if not rows:
             QMessageBox.information(self, APP_TITLE, "複製するページを選択してください。"); return
-        copies = [self._edit_pages[r] for r in rows]
-        self._edit_pages.extend(copies)
+        # 参照タプルをそのまま末尾へ足す（中間リストは作らない。rows は追加前の範囲だけを指す）
+        self._edit_pages.extend(map(self._edit_pages.__getitem__, rows))
         self._refresh_edit_list()
         self.log_msg_edit(f"複製: {len(rows)}ページ（末尾に追加）")
 
+    def _insert_reader(self, path: str) -> Optional[PdfReader]:
+        """挿入元の PdfReader（暗号化で開けなければ None）。最近使った数件を使い回す"""
+        key = (os.path.abspath(path), os.path.getmtime(path))
+        cache = self._inserter_readers
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        r = _open_reader(path)
+        cache[key] = r
+        if len(cache) > _INSERT_READER_CACHE:
+            cache.popitem(last=False)  # 挿入済みページは (reader, index, 回転) で reader を参照しているので追い出しても問題ない
+        return r
+
     def on_edit_insert_pages(self):
         if self._edit_pages is None:
             QMessageBox.warning(self, APP_TITLE, "PDFを読み込んでください。"); return
@@ -969,30 +1606,69 @@ class PdfManagerWindow(QMainWindow):
         src_path, _ = QFileDialog.getOpenFileName(self, "挿入元PDFを選択", "", "PDF (*.pdf)")
         if not src_path: return
         try:
-            r = PdfReader(src_path, strict=False)
-            if r.is_encrypted:
-                try: r.decrypt("")
-                except Exception:
-                    QMessageBox.warning(self, APP_TITLE, "暗号化PDFは挿入できません。"); return
+            r = self._insert_reader(src_path)
+            if r is None:
+                QMessageBox.warning(self, APP_TITLE, "暗号化PDFは挿入できません。"); return
             total = len(r.pages)
         except Exception as e:
             QMessageBox.critical(self, APP_TITLE, f"挿入元の読み込みに失敗しました。\n\n{e}")
             return
-        ranges, ok = QtWidgets.QInputDialog.getText(self, "挿入範囲", f"挿入するページ範囲を指定（1-{total}）：例 1-3,5")
+        ranges, ok = QtWidgets.QInputDialog.getText(self, "挿入範囲", f"挿入するページ範囲を指定（1-{total}）：例 1-3,5（* で全ページ）")
         if not ok or not ranges.strip(): return
         rs = parse_ranges(ranges, total)
         if not rs:
             QMessageBox.information(self, APP_TITLE, "範囲の指定が不正です。"); return
-        pages_to_insert = []
-        for s, e in rs:
-            for i in range(s-1, e):
-                pages_to_insert.append(r.pages[i])
-        for offset, pg in enumerate(pages_to_insert):
-            self._edit_pages.insert(pos + offset, pg)
+        # PageObject は引かず (reader, index, 0) のまま。まとめて1回で差し込む（1ページずつ insert すると O(k·N)）
+        pages_to_insert = [(r, i, 0) for s, e in rs for i in range(s-1, e)]
+        self._edit_pages[pos:pos] = pages_to_insert
         self._refresh_edit_list()
         self.list_edit_pages.setCurrentRow(pos)
         self.log_msg_edit(f"挿入: {len(pages_to_insert)}ページ（位置: {pos+1} の前）")
 
+    def _save_edit_pypdf(self, dest: str, feedback: _WorkerFeedback):
+        w = PdfWriter()
+        total = len(self._edit_pages)
+        for i, (reader, index, extra) in enumerate(self._edit_pages, start=1):
+            _add_rotated_page(w, reader.pages[index], extra)
+            feedback.progress(i, total)
+        with _open_for_write(dest) as f:
+            w.write(f)
+
+    def _save_edit_fitz(self, dest: str, feedback: _WorkerFeedback) -> bool:
+        """ページ数の多い保存用。プレビュー用の fitz 文書から連続区間ごとに C 側でコピーする
+        （PdfWriter のように全ページを Python オブジェクトとして抱えない）。開けない読み込み元があれば False"""
+        pages = self._edit_pages
+        docs = {}
+        for reader, _, _ in pages:
+            if reader not in docs:
+                docs[reader] = self._edit_fitz_doc(reader)
+                if docs[reader] is None:
+                    return False
+        out = fitz.open()
+        try:
+            total = len(pages)
+            i = 0
+            while i < total:
+                reader, start, _ = pages[i]
+                j = i + 1
+                while j < total and pages[j][0] is reader and pages[j][1] == pages[j-1][1] + 1:
+                    j += 1
+                # final=False で読み込み元ごとのコピー済みオブジェクト表を残す（複製ページはリソースを共有する）
+                out.insert_pdf(docs[reader], from_page=start, to_page=pages[j-1][1], final=False)
+                i = j
+                feedback.progress(i, total)
+            # 向きは行ごとに決める（プレビュー用の文書は最後に表示した向きになっている）
+            for k in range(total):
+                rotation = self._edit_rotation(k)
+                page = out[k]
+                if page.rotation != rotation:
+                    page.set_rotation(rotation)
+            with _open_for_write(dest) as f:
+                out.save(f, garbage=0, deflate=False)
+        finally:
+            out.close()
+        return True
+
     def on_edit_save(self, overwrite: bool):
         if not self._edit_pages:
             QMessageBox.warning(self, APP_TITLE, "PDFを読み込んでください。"); return
@@ -1007,14 +1683,10 @@ class PdfManagerWindow(QMainWindow):
         if not dest.lower().endswith(".pdf"): dest += ".pdf"
 
         try:
-            w = PdfWriter()
-            total = len(self._edit_pages)
-            for i, p in enumerate(self._edit_pages, start=1):
-                w.add_page(p)
-                if total:
-                    self.prog_edit.setValue(int(i/total*100))
-            with open(dest, "wb") as f:
-                w.write(f)
+            # ワーカーと同様、% が変わったときだけ進捗バーを更新する
+            feedback = _WorkerFeedback(self.prog_edit.setValue, self.log_msg_edit, logging=False)
+            if not (_FitzOK and len(self._edit_pages) >= _EDIT_LOWMEM_PAGES and self._save_edit_fitz(dest, feedback)):
+                self._save_edit_pypdf(dest, feedback)
             self.log_msg_edit(f"保存: {dest}")
             QMessageBox.information(self, APP_TITLE, f"保存しました。\n\n出力: {dest}")
         except Exception as e:
@@ -1028,55 +1700,221 @@ class PdfManagerWindow(QMainWindow):
             self._preview_zoom_mode = "free"
             self._preview_scale *= (mul or 1.0)
             self._preview_scale = max(0.1, min(8.0, self._preview_scale))
-        self._render_preview(self._current_preview_index)
+        self._render_timer.start()
 
     def eventFilter(self, obj, event):
         # レイアウトサイズ変更時にフィット系を再計算
         if obj is self.preview_scroll.viewport() and event.type() == QtCore.QEvent.Resize:
             if self._preview_zoom_mode in ("fitw", "fitp"):
-                self._render_preview(self._current_preview_index)
+                self._render_timer.start()
         return super().eventFilter(obj, event)
 
-    def _render_preview(self, row: int):
-        if not _FitzOK:
-            self.preview_label.setText("プレビューを有効にするには:\n\npip install pymupdf")
-            return
+    def _render_preview_disabled(self, row: int):
+        self.preview_label.setText("プレビューを有効にするには:\n\npip install pymupdf")
+
+    def _render_preview_impl(self, row: int):
         if row is None or row < 0 or row >= len(self._edit_pages):
+            self._preview_generation += 1  # 保留中の本描画/先読みも無効にする
+            self._last_render_key = None
             self.preview_label.setText("ページを選択してください")
             return
 
-        # 現在のPageObjectだけで1ページPDFを作り、メモリ上でレンダリング
         try:
-            buf = io.BytesIO()
-            w = PdfWriter()
-            w.add_page(self._edit_pages[row])
-            w.write(buf); data = buf.getvalue(); buf.close()
-
-            doc = fitz.open(stream=data, filetype="pdf")
-            page = doc[0]
-
-            # 目標スケール計算
-            viewport = self.preview_scroll.viewport().size()
-            vw, vh = max(1, viewport.width()-6), max(1, viewport.height()-6)
-            pw, ph = page.rect.width, page.rect.height
-
-            if self._preview_zoom_mode == "fitw":
-                scale = vw / pw
-            elif self._preview_zoom_mode == "fitp":
-                scale = min(vw / pw, vh / ph)
-            else:
-                scale = self._preview_scale
-
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat, alpha=True)
-            fmt = QImage.Format_RGBA8888 if pix.alpha else QImage.Format_RGB888
-            img = QImage(pix.samples, pix.width, pix.height, pix.stride, fmt).copy()
-            self.preview_label.setPixmap(QPixmap.fromImage(img))
-            self.preview_info.setText(f"ページ {row+1} / {len(self._edit_pages)}  |  {pix.width}×{pix.height}px  |  zoom={scale:.2f}x")
+            rotation, scale, pw, ph = self._preview_geometry(row)
+            if self._render_key(row, rotation, scale) == self._last_render_key:
+                return  # 同じページを同じ向き/倍率で表示済み（サイズの変わらないリサイズ等）
+            self._preview_generation += 1
+            if scale > _PREVIEW_DRAFT_SCALE and self._preview_cache_key(row, rotation, scale) not in self._preview_cache:
+                # 先に低解像度版を引き伸ばして表示し、本描画はイベントループに戻ってから行う
+                draft = self._preview_pixmap(row, rotation, _PREVIEW_DRAFT_SCALE)
+                dpr = draft.devicePixelRatio()
+                draft = draft.scaled(round(pw*scale*dpr), round(ph*scale*dpr), Qt.IgnoreAspectRatio, Qt.FastTransformation)
+                draft.setDevicePixelRatio(dpr)
+                self.preview_label.setPixmap(draft)
+                gen = self._preview_generation
+                QtCore.QTimer.singleShot(0, lambda: self._refine_preview(gen, row, rotation, scale))
+                return
+            self._show_preview(row, rotation, self._preview_pixmap(row, rotation, scale), scale)
+        except Exception as e:
+            self._last_render_key = None
+            self.preview_label.setText(f"プレビューに失敗しました。\n{e}")
+            return
+        self._start_prewarm(row)
+
+    def _render_key(self, row: int, rotation: int, scale: float) -> tuple:
+        # 情報欄の「ページ n / 全体」も変わるので行番号とページ数も含める
+        return (row, len(self._edit_pages), *self._preview_cache_key(row, rotation, scale))
+
+    def _preview_cache_key(self, row: int, rotation: int, scale: float) -> tuple:
+        # HiDPI では物理ピクセルで描画するため、画面（devicePixelRatio）が変われば別の描画になる
+        return (*self._edit_pages[row][:2], rotation, scale, self.preview_label.devicePixelRatioF())
+
+    def _preview_geometry(self, row: int) -> Tuple[int, float, float, float]:
+        """(rotation, scale, 回転後の幅, 高さ) を現在のズーム設定とビューポートから求める"""
+        page = self._edit_page(row)
+        rotation = self._edit_rotation(row)
+        box = page.cropbox
+        pw, ph = abs(float(box.width)), abs(float(box.height))
+        if rotation in (90, 270):
+            pw, ph = ph, pw
+
+        # 目標スケール計算
+        viewport = self.preview_scroll.viewport().size()
+        vw, vh = max(1, viewport.width()-6), max(1, viewport.height()-6)
+
+        if self._preview_zoom_mode == "fitw":
+            scale = vw / pw
+        elif self._preview_zoom_mode == "fitp":
+            scale = min(vw / pw, vh / ph)
+        else:
+            # 自由ズームは 1.15 倍刻みなので、丸めて浮動小数の誤差でキャッシュを外さないようにする
+            scale = round(self._preview_scale, 2)
+        return rotation, scale, pw, ph
 
-            doc.close()
+    def _refine_preview(self, gen: int, row: int, rotation: int, scale: float):
+        if gen != self._preview_generation:
+            return  # 別ページ/別倍率の描画が始まっている
+        try:
+            self._show_preview(row, rotation, self._preview_pixmap(row, rotation, scale), scale)
         except Exception as e:
+            self._last_render_key = None
             self.preview_label.setText(f"プレビューに失敗しました。\n{e}")
+            return
+        self._start_prewarm(row)
+
+    def _start_prewarm(self, row: int):
+        # 次に開かれやすい前後のページを、イベントループの空き時間に1ページずつキャッシュへ描画しておく
+        # （fitz 文書はスレッドセーフでないため GUI スレッドで行い、操作があれば世代番号で打ち切る）
+        rows = [r for d in range(1, _PREVIEW_PREWARM + 1) for r in (row + d, row - d) if 0 <= r < len(self._edit_pages)]
+        gen = self._preview_generation
+        QtCore.QTimer.singleShot(0, lambda: self._prewarm_preview(gen, rows))
+
+    def _prewarm_preview(self, gen: int, rows: List[int]):
+        if gen != self._preview_generation or not rows:
+            return
+        try:
+            rotation, scale, _, _ = self._preview_geometry(rows[0])
+            self._preview_pixmap(rows[0], rotation, scale)
+        except Exception:
+            pass  # 先読みの失敗はそのページを表示するときに扱う
+        QtCore.QTimer.singleShot(0, lambda: self._prewarm_preview(gen, rows[1:]))
+
+    def _show_preview(self, row: int, rotation: int, pixmap: QPixmap, scale: float):
+        self._last_render_key = self._render_key(row, rotation, scale)
+        self.preview_label.setPixmap(pixmap)
+        dpr = pixmap.devicePixelRatio()
+        self.preview_info.setText(f"ページ {row+1} / {len(self._edit_pages)}  |  {round(pixmap.width()/dpr)}×{round(pixmap.height()/dpr)}px  |  zoom={scale:.2f}x")
+
+    def _preview_pixmap(self, row: int, rotation: int, scale: float) -> QPixmap:
+        key = self._preview_cache_key(row, rotation, scale)
+        pixmap = self._preview_cache.get(key)
+        if pixmap is not None:
+            self._preview_cache.move_to_end(key)
+            return pixmap
+        # scale は論理ピクセル基準。HiDPI では物理ピクセル数で一度だけラスタライズし、Qt 側の拡大ぼけを避ける
+        dpr = key[-1]
+        pixmap = self._rasterize_page(row, scale * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        self._preview_cache[key] = pixmap
+        self._preview_cache_bytes += _pixmap_bytes(pixmap)
+        # 件数とバイト数の両方で古いものから捨てる（直前に追加した1件は残す）
+        while len(self._preview_cache) > 1 and (
+                len(self._preview_cache) > _PREVIEW_CACHE_SIZE or self._preview_cache_bytes > _PREVIEW_CACHE_BYTES):
+            _, old = self._preview_cache.popitem(last=False)
+            self._preview_cache_bytes -= _pixmap_bytes(old)
+        return pixmap
+
+    def _drop_preview_cache(self, refs=None):
+        """refs（(読み込み元, 元のページ番号) の集合）の描画結果を捨てる。None なら全件"""
+        if refs is None:
+            self._preview_cache.clear()
+            self._preview_cache_bytes = 0
+            self._preview_displaylists.clear()
+            return
+        for key in [k for k in self._preview_cache if k[:2] in refs]:
+            self._preview_cache_bytes -= _pixmap_bytes(self._preview_cache.pop(key))
+        for key in [k for k in self._preview_displaylists if k[:2] in refs]:
+            del self._preview_displaylists[key]
+
+    def _edit_fitz_doc(self, reader: PdfReader) -> Optional["fitz.Document"]:
+        """reader と同じ内容の fitz 文書（開けない場合は None）。pypdf が読み込み済みのバッファを共有する"""
+        if reader in self._edit_fitz_docs:
+            return self._edit_fitz_docs[reader]
+        doc = None
+        stream = getattr(reader, "stream", None)
+        if isinstance(stream, io.BytesIO):
+            try:
+                try:
+                    doc = fitz.open(stream=stream.getbuffer(), filetype="pdf")
+                except TypeError:
+                    # 古い PyMuPDF（1.24.0 など）は memoryview を受け付けないのでコピーを渡す
+                    doc = fitz.open(stream=stream.getvalue(), filetype="pdf")
+                # ページ番号は pypdf と同じものとして使う（保存もこれに頼る）ので、数え方が違えば使わない
+                if (doc.needs_pass and not doc.authenticate("")) or doc.page_count != len(reader.pages):
+                    doc.close()
+                    doc = None
+            except Exception:
+                doc = None
+        self._edit_fitz_docs[reader] = doc
+        return doc
+
+    def _close_edit_fitz_docs(self):
+        self._drop_preview_cache()
+        for doc in self._edit_fitz_docs.values():
+            if doc is not None:
+                doc.close()
+        self._edit_fitz_docs.clear()
+
+    def _page_displaylist(self, doc: "fitz.Document", reader: PdfReader, index: int, rotation: int) -> "fitz.DisplayList":
+        # DisplayList は作成時の /Rotate を含むので、向きごとに別のものとして持つ
+        key = (reader, index, rotation)
+        cache = self._preview_displaylists
+        dl = cache.get(key)
+        if dl is not None:
+            cache.move_to_end(key)
+            return dl
+        fpage = doc[index]
+        if fpage.rotation != rotation:
+            fpage.set_rotation(rotation)
+        dl = cache[key] = fpage.get_displaylist()
+        if len(cache) > _PREVIEW_DISPLAYLIST_CACHE:
+            cache.popitem(last=False)
+        return dl
+
+    def _rasterize_page(self, row: int, scale: float) -> QPixmap:
+        reader, index, extra = self._edit_pages[row]
+        doc = self._edit_fitz_doc(reader)
+        if doc is not None:
+            # 元文書のページを直接描画する（編集は回転のみなので /Rotate だけ合わせる）
+            rotation = self._edit_rotation(row)
+            dl = self._page_displaylist(doc, reader, index, rotation)
+            return self._pixmap_to_qpixmap(dl.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False))
+
+        # 開けなかった場合はこのページだけで1ページPDFを作り、メモリ上でレンダリング
+        buf = io.BytesIO()
+        w = PdfWriter()
+        _add_rotated_page(w, reader.pages[index], extra)
+        w.write(buf); data = buf.getvalue(); buf.close()
+
+        doc = fitz.open(stream=data, filetype="pdf")
+        try:
+            return self._pixmap_to_qpixmap(doc[0].get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False))
+        finally:
+            doc.close()
+
+    @staticmethod
+    def _pixmap_to_qpixmap(pix) -> QPixmap:
+        # samples_mv は MuPDF のバッファをコピーせずに参照する（pix はこの関数内で生きている）。
+        # 既定の fromImage は RGB32 へ変換しながらコピーするが、RGB888 のまま1回複製して
+        # NoFormatConversion で渡す方が速く、キャッシュ上の画素も 3/4 で済む（描画速度は同等）
+        img = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, _FMT_RGB)
+        return QPixmap.fromImage(img.copy(), Qt.NoFormatConversion)
+
+    def closeEvent(self, event):
+        for w in self.findChildren(PageCountWorker):
+            w.wait()
+        self._close_edit_fitz_docs()
+        super().closeEvent(event)
 
     # --- about / howto ---
     def on_about(self):
@@ -1101,6 +1939,7 @@ class PdfManagerWindow(QMainWindow):
 
 
 def main():
+    multiprocessing.freeze_support()  # PyInstaller (EXE) でのプロセスプール用
     # High DPI
     QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
     QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)